@@ -0,0 +1 @@
+"""Initialize benchmarks package"""
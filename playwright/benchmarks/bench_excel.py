@@ -0,0 +1,47 @@
+from pathlib import Path
+from typing import Any, Dict, List
+import tempfile
+
+from src.utils.excel_utility import ExcelUtility
+from benchmarks.results import measure, summarize
+
+ROW_COUNTS = [1_000, 10_000, 100_000]
+
+
+def generate_rows(row_count: int) -> List[Dict[str, Any]]:
+    """Generate login-style rows matching the layout of login-data.xlsx"""
+    return [
+        {
+            'testCase': f'case_{idx}',
+            'username': f'user_{idx}',
+            'password': f'secret_{idx}',
+            'expected': 'success' if idx % 2 else 'error',
+            'attempts': idx % 5,
+        }
+        for idx in range(row_count)
+    ]
+
+
+def run(repeats: int, row_counts: List[int] = ROW_COUNTS) -> Dict[str, Dict[str, Any]]:
+    """
+    Benchmark ExcelUtility write and read throughput
+
+    Args:
+        repeats: Number of timed runs per benchmark
+        row_counts: Workbook sizes to generate
+
+    Returns:
+        Benchmark name to summary entry
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for row_count in row_counts:
+            rows = generate_rows(row_count)
+            excel_utility = ExcelUtility(str(Path(tmp_dir) / f'rows-{row_count}.xlsx'))
+
+            write_samples = measure(lambda: excel_utility.write_excel_file(rows, 'Data'), repeats)
+            results[f'excel.write[{row_count}]'] = summarize(write_samples, items=row_count)
+
+            read_samples = measure(lambda: excel_utility.read_excel_file('Data'), repeats)
+            results[f'excel.read[{row_count}]'] = summarize(read_samples, items=row_count)
+    return results
@@ -0,0 +1,45 @@
+from typing import Any, Dict
+
+from playwright.async_api import async_playwright
+from benchmarks.results import summarize
+import time
+
+
+async def run(repeats: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Benchmark the setup cost paid by the test fixtures
+
+    Args:
+        repeats: Number of timed runs per benchmark
+
+    Returns:
+        Benchmark name to summary entry
+    """
+    launch_samples = []
+    context_samples = []
+    page_samples = []
+
+    async with async_playwright() as p:
+        # Untimed warmup so the first launch does not pay for cold disk caches
+        await (await p.chromium.launch()).close()
+
+        for _ in range(repeats):
+            started = time.perf_counter()
+            browser = await p.chromium.launch()
+            launch_samples.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            context = await browser.new_context()
+            context_samples.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            await context.new_page()
+            page_samples.append(time.perf_counter() - started)
+
+            await browser.close()
+
+    return {
+        'fixture.browser_launch': summarize(launch_samples),
+        'fixture.new_context': summarize(context_samples),
+        'fixture.new_page': summarize(page_samples),
+    }
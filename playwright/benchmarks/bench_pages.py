@@ -0,0 +1,60 @@
+from typing import Any, Dict
+
+from playwright.async_api import async_playwright
+from src.pages.login_page import LoginPage
+from src.pages.home_page import HomePage
+from src.pages.cart_page import CartPage
+from benchmarks.results import measure_async, summarize
+from benchmarks.server import StaticAppServer
+
+
+async def run(repeats: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Benchmark page-object action latency against the offline static app
+
+    Navigation needed to reset page state runs untimed before every sample.
+
+    Args:
+        repeats: Number of timed runs per benchmark
+
+    Returns:
+        Benchmark name to summary entry
+    """
+    results = {}
+    with StaticAppServer() as server:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch()
+            context = await browser.new_context(base_url=server.base_url)
+            page = await context.new_page()
+            login_page = LoginPage(page)
+            home_page = HomePage(page)
+            cart_page = CartPage(page)
+
+            samples = await measure_async(
+                lambda: login_page.login('standard_user', 'secret_sauce'),
+                repeats,
+                setup=login_page.navigate_to,
+                # Let the redirect finish so the next navigate_to() does not interrupt it
+                teardown=lambda: page.wait_for_url('**/inventory.html'),
+                warmup=1,
+            )
+            results['page.LoginPage.login'] = summarize(samples)
+
+            await page.goto('/inventory.html')
+            samples = await measure_async(
+                lambda: home_page.get_product_details(0),
+                repeats,
+                warmup=1,
+            )
+            results['page.HomePage.get_product_details'] = summarize(samples)
+
+            samples = await measure_async(
+                lambda: cart_page.remove_from_cart_by_name('Sauce Labs Backpack'),
+                repeats,
+                setup=cart_page.navigate_to_cart,
+                warmup=1,
+            )
+            results['page.CartPage.remove_from_cart_by_name'] = summarize(samples)
+
+            await browser.close()
+    return results
@@ -0,0 +1,219 @@
+from typing import Any, Dict, List, Optional, Tuple
+import argparse
+import math
+import statistics
+import sys
+
+from benchmarks.results import load_results
+
+# Largest combined sample size for which the exact U distribution is computed
+EXACT_MAX_SAMPLES = 40
+
+# Environment fields that must match for a comparison to be meaningful
+ENVIRONMENT_KEYS = ['machine', 'platform', 'python', 'playwright', 'openpyxl']
+
+
+def minimum_p_value(n1: int, n2: int) -> float:
+    """Smallest one-sided p-value the exact test can reach for these sample sizes"""
+    return 1 / math.comb(n1 + n2, n2)
+
+
+def _exact_upper_tail(n1: int, n2: int, u: float) -> float:
+    """
+    P(U >= u) under the null hypothesis, counting every rank assignment
+
+    Args:
+        n1: Baseline sample size
+        n2: Current sample size
+        u: Observed U statistic of the current samples
+
+    Returns:
+        Exact one-sided p-value
+    """
+    # ways[k][s]: number of k-element subsets of ranks 1..N with rank sum s
+    total = n1 + n2
+    max_sum = total * (total + 1) // 2
+    ways = [[0] * (max_sum + 1) for _ in range(n2 + 1)]
+    ways[0][0] = 1
+    for rank in range(1, total + 1):
+        for k in range(min(rank, n2), 0, -1):
+            for rank_sum in range(max_sum, rank - 1, -1):
+                ways[k][rank_sum] += ways[k - 1][rank_sum - rank]
+
+    min_rank_sum = n2 * (n2 + 1) // 2
+    threshold = math.ceil(u + min_rank_sum - 1e-9)
+    tail = sum(ways[n2][rank_sum] for rank_sum in range(max(threshold, 0), max_sum + 1))
+    return tail / math.comb(total, n2)
+
+
+def mann_whitney_p_value(baseline: List[float], current: List[float]) -> float:
+    """
+    One-sided Mann-Whitney U test that current samples are larger than baseline
+
+    Small samples without ties use the exact U distribution. Otherwise the
+    normal approximation with tie and continuity correction is used, so no
+    third-party statistics package is needed.
+
+    Args:
+        baseline: Baseline durations
+        current: Current durations
+
+    Returns:
+        p-value, small when current is significantly slower
+    """
+    n1, n2 = len(baseline), len(current)
+    if n1 < 2 or n2 < 2:
+        return 1.0
+
+    combined = sorted((value, group) for group, values in enumerate((baseline, current)) for value in values)
+    ranks = [0.0] * len(combined)
+    tie_term = 0.0
+    idx = 0
+    while idx < len(combined):
+        end = idx
+        while end + 1 < len(combined) and combined[end + 1][0] == combined[idx][0]:
+            end += 1
+        for tied in range(idx, end + 1):
+            ranks[tied] = (idx + end) / 2 + 1
+        tie_count = end - idx + 1
+        tie_term += tie_count ** 3 - tie_count
+        idx = end + 1
+
+    current_rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 1)
+    u_current = current_rank_sum - n2 * (n2 + 1) / 2
+    total = n1 + n2
+    if tie_term == 0 and total <= EXACT_MAX_SAMPLES:
+        return _exact_upper_tail(n1, n2, u_current)
+
+    mean_u = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+
+    z = (u_current - mean_u - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def environment_differences(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """
+    List environment fields that differ between two results documents
+
+    Args:
+        baseline: Baseline results document
+        current: Current results document
+
+    Returns:
+        One description per differing field
+    """
+    baseline_env = baseline.get('environment', {})
+    current_env = current.get('environment', {})
+    return [
+        f'{key}: {baseline_env.get(key)} -> {current_env.get(key)}'
+        for key in ENVIRONMENT_KEYS
+        if baseline_env.get(key) != current_env.get(key)
+    ]
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    alpha: float = 0.05,
+    threshold: float = 0.05,
+) -> List[Dict[str, Any]]:
+    """
+    Compare two results documents benchmark by benchmark
+
+    A benchmark regresses when it is slower with p < alpha and its median grew
+    by more than threshold, so tiny but consistent changes are not flagged.
+    Rows whose sample sizes cannot reach p < alpha are marked underpowered.
+
+    Args:
+        baseline: Baseline results document
+        current: Current results document
+        alpha: Significance level of the one-sided test
+        threshold: Minimum relative slowdown of the median
+
+    Returns:
+        One row per benchmark present in both documents
+    """
+    rows = []
+    for name in sorted(set(baseline['benchmarks']) & set(current['benchmarks'])):
+        baseline_samples = baseline['benchmarks'][name]['samples']
+        current_samples = current['benchmarks'][name]['samples']
+        baseline_median = statistics.median(baseline_samples)
+        current_median = statistics.median(current_samples)
+        change = current_median / baseline_median - 1 if baseline_median else 0.0
+        p_value = mann_whitney_p_value(baseline_samples, current_samples)
+        rows.append({
+            'name': name,
+            'baseline_median': baseline_median,
+            'current_median': current_median,
+            'change': change,
+            'p_value': p_value,
+            'regression': p_value < alpha and change > threshold,
+            'underpowered': minimum_p_value(len(baseline_samples), len(current_samples)) >= alpha,
+        })
+    return rows
+
+
+def format_report(rows: List[Dict[str, Any]], missing: Tuple[List[str], List[str]]) -> str:
+    """Render comparison rows as a plain-text table"""
+    lines = [f'{"benchmark":<45} {"baseline":>10} {"current":>10} {"change":>8} {"p":>7}']
+    for row in rows:
+        flag = '  REGRESSION' if row['regression'] else ''
+        if row['underpowered']:
+            flag = '  too few samples to detect a regression'
+        lines.append(
+            f'{row["name"]:<45} {row["baseline_median"] * 1000:>8.2f}ms '
+            f'{row["current_median"] * 1000:>8.2f}ms {row["change"]:>+8.1%} {row["p_value"]:>7.3f}{flag}'
+        )
+    only_baseline, only_current = missing
+    for name in only_baseline:
+        lines.append(f'{name:<45} missing from current run')
+    for name in only_current:
+        lines.append(f'{name:<45} new, no baseline')
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Compare a results file against a baseline; exit 1 on regressions"""
+    parser = argparse.ArgumentParser(description='Flag statistically significant benchmark regressions')
+    parser.add_argument('baseline', help='Baseline results JSON')
+    parser.add_argument('current', help='Current results JSON')
+    parser.add_argument('--alpha', type=float, default=0.05, help='Significance level (default: 0.05)')
+    parser.add_argument('--threshold', type=float, default=0.05,
+                        help='Minimum relative slowdown of the median (default: 0.05)')
+    parser.add_argument('--strict', action='store_true',
+                        help='Refuse to compare results recorded in different environments')
+    args = parser.parse_args(argv)
+
+    baseline = load_results(args.baseline)
+    current = load_results(args.current)
+
+    differences = environment_differences(baseline, current)
+    if differences:
+        print('WARNING: results were recorded in different environments:', file=sys.stderr)
+        for difference in differences:
+            print(f'  {difference}', file=sys.stderr)
+        if args.strict:
+            print('Refusing to compare in --strict mode', file=sys.stderr)
+            return 2
+
+    rows = compare_results(baseline, current, alpha=args.alpha, threshold=args.threshold)
+    missing = (
+        sorted(set(baseline['benchmarks']) - set(current['benchmarks'])),
+        sorted(set(current['benchmarks']) - set(baseline['benchmarks'])),
+    )
+
+    print(f'baseline: {baseline["label"]} ({baseline["created"]})  current: {current["label"]} ({current["created"]})')
+    print(format_report(rows, missing))
+
+    regressions = [row['name'] for row in rows if row['regression']]
+    if regressions:
+        print(f'\n{len(regressions)} regression(s): {", ".join(regressions)}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
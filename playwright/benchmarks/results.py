@@ -0,0 +1,181 @@
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+# Bump when the layout of the results file changes
+SCHEMA_VERSION = 1
+
+BASELINE_DIR = Path(__file__).parent / 'baselines'
+
+
+def measure(
+    action: Callable[[], Any],
+    repeats: int,
+    setup: Optional[Callable[[], Any]] = None,
+    warmup: int = 0,
+) -> List[float]:
+    """
+    Time a synchronous action
+
+    Args:
+        action: Callable to time
+        repeats: Number of timed runs
+        setup: Optional untimed callable run before each run
+        warmup: Number of untimed runs before measuring
+
+    Returns:
+        Duration of each timed run in seconds
+    """
+    samples = []
+    for run_idx in range(warmup + repeats):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        action()
+        if run_idx >= warmup:
+            samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def measure_async(
+    action: Callable[[], Any],
+    repeats: int,
+    setup: Optional[Callable[[], Any]] = None,
+    teardown: Optional[Callable[[], Any]] = None,
+    warmup: int = 0,
+) -> List[float]:
+    """
+    Time an async action
+
+    Args:
+        action: Coroutine function to time
+        repeats: Number of timed runs
+        setup: Optional untimed coroutine function run before each run
+        teardown: Optional untimed coroutine function run after each run
+        warmup: Number of untimed runs before measuring
+
+    Returns:
+        Duration of each timed run in seconds
+    """
+    samples = []
+    for run_idx in range(warmup + repeats):
+        if setup:
+            await setup()
+        started = time.perf_counter()
+        await action()
+        if run_idx >= warmup:
+            samples.append(time.perf_counter() - started)
+        if teardown:
+            await teardown()
+    return samples
+
+
+def summarize(samples: List[float], items: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Build the stored entry for a benchmark
+
+    Args:
+        samples: Duration of each run in seconds
+        items: Number of items processed per run, adds a throughput figure
+
+    Returns:
+        Dictionary with raw samples and summary statistics
+    """
+    entry: Dict[str, Any] = {
+        'unit': 's',
+        'samples': samples,
+        'median': statistics.median(samples),
+        'mean': statistics.mean(samples),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'min': min(samples),
+    }
+    if items:
+        entry['items'] = items
+        entry['items_per_s'] = items / entry['median']
+    return entry
+
+
+def _git_commit() -> Optional[str]:
+    """Return the current short commit hash, if available"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _package_version(name: str) -> Optional[str]:
+    """Return the installed version of a package, if available"""
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return None
+
+
+def build_results(benchmarks: Dict[str, Dict[str, Any]], label: str) -> Dict[str, Any]:
+    """
+    Wrap benchmark entries with the metadata needed to compare runs
+
+    Args:
+        benchmarks: Benchmark name to summary entry
+        label: Name of this run, e.g. the baseline version
+
+    Returns:
+        Results document ready to be saved
+    """
+    return {
+        'schema_version': SCHEMA_VERSION,
+        'label': label,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'environment': {
+            'commit': _git_commit(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'playwright': _package_version('playwright'),
+            'openpyxl': _package_version('openpyxl'),
+        },
+        'benchmarks': benchmarks,
+    }
+
+
+def save_results(results: Dict[str, Any], file_path: str) -> None:
+    """Write a results document as JSON"""
+    path = Path(file_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as results_file:
+        json.dump(results, results_file, indent=2, sort_keys=True)
+        results_file.write('\n')
+
+
+def load_results(file_path: str) -> Dict[str, Any]:
+    """
+    Read a results document
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        Results document
+    """
+    if not Path(file_path).exists():
+        raise FileNotFoundError(f'Benchmark results not found at: {file_path}')
+
+    with open(file_path, encoding='utf-8') as results_file:
+        results = json.load(results_file)
+
+    if results.get('schema_version') != SCHEMA_VERSION:
+        raise ValueError(
+            f'Unsupported benchmark schema version {results.get("schema_version")} '
+            f'in {file_path}, expected {SCHEMA_VERSION}'
+        )
+    return results
@@ -0,0 +1,74 @@
+from typing import Any, Dict, List, Optional
+import argparse
+import asyncio
+import sys
+
+from benchmarks import bench_excel, bench_fixtures, bench_pages
+from benchmarks.results import BASELINE_DIR, build_results, save_results
+
+SUITES = ['excel', 'pages', 'fixtures']
+
+# 5 vs 5 samples give a smallest exact p-value of 1/252 (~0.004)
+MIN_REPEATS = 5
+
+
+def run_suites(suites: List[str], repeats: int, row_counts: List[int]) -> Dict[str, Dict[str, Any]]:
+    """
+    Run the selected benchmark suites
+
+    Args:
+        suites: Names from SUITES
+        repeats: Number of timed runs per benchmark
+        row_counts: Workbook sizes for the excel suite
+
+    Returns:
+        Benchmark name to summary entry
+    """
+    benchmarks: Dict[str, Dict[str, Any]] = {}
+    if 'excel' in suites:
+        benchmarks.update(bench_excel.run(repeats, row_counts))
+    if 'pages' in suites:
+        benchmarks.update(asyncio.run(bench_pages.run(repeats)))
+    if 'fixtures' in suites:
+        benchmarks.update(asyncio.run(bench_fixtures.run(repeats)))
+    return benchmarks
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run benchmarks and write a results JSON file"""
+    parser = argparse.ArgumentParser(description='Run the offline benchmark suite')
+    parser.add_argument('--suite', choices=SUITES, action='append',
+                        help='Suite to run, may be repeated (default: all)')
+    parser.add_argument('--repeats', type=int, default=10, help='Timed runs per benchmark (default: 10)')
+    parser.add_argument('--rows', type=int, action='append',
+                        help='Workbook row count for the excel suite, may be repeated (default: 1000, 10000, 100000)')
+    parser.add_argument('--label', default='current', help='Name stored in the results file')
+    parser.add_argument('--output', default='benchmark-results.json', help='Results file to write')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Also write the results to benchmarks/baselines/<label>.json')
+    args = parser.parse_args(argv)
+
+    if args.repeats < MIN_REPEATS:
+        parser.error(
+            f'--repeats must be at least {MIN_REPEATS} for the comparator to detect '
+            'regressions at p < 0.05'
+        )
+
+    benchmarks = run_suites(args.suite or SUITES, args.repeats, args.rows or bench_excel.ROW_COUNTS)
+    results = build_results(benchmarks, args.label)
+
+    save_results(results, args.output)
+    print(f'Wrote {len(benchmarks)} benchmarks to {args.output}')
+    if args.save_baseline:
+        baseline_path = BASELINE_DIR / f'{args.label}.json'
+        save_results(results, str(baseline_path))
+        print(f'Saved baseline {baseline_path}')
+
+    for name, entry in sorted(benchmarks.items()):
+        throughput = f'  {entry["items_per_s"]:,.0f} rows/s' if 'items_per_s' in entry else ''
+        print(f'{name:<45} median {entry["median"] * 1000:>9.2f} ms{throughput}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,40 @@
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import threading
+
+STATIC_APP_DIR = Path(__file__).parent / 'static_app'
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """Static file handler that does not log every request"""
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class StaticAppServer:
+    """Serve the offline copy of Sauce Demo on a free local port"""
+
+    def __init__(self, directory: Path = STATIC_APP_DIR):
+        self.directory = directory
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the running server"""
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def __enter__(self) -> 'StaticAppServer':
+        handler = partial(_QuietHandler, directory=str(self.directory))
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
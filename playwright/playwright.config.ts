@@ -7,7 +7,8 @@ export default defineConfig({
   testDir: './tests',
   timeout: 30_000,
   fullyParallel: true,
-  retries: 0,
+  // A failing test is retried once and only the retry is traced
+  retries: 1,
   workers: process.env.CI ? 1 : undefined,
   reporter: 'html',
   use: {
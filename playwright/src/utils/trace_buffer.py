@@ -0,0 +1,336 @@
+from playwright.async_api import BrowserContext, Page, ConsoleMessage, Request, Response
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+import asyncio
+import json
+import os
+import random
+import re
+import shutil
+import tempfile
+import time
+
+
+def _env_flag(name: str, default: str) -> bool:
+    """Read an on/off environment variable"""
+    return os.getenv(name, default).lower() not in ('0', 'off', 'false', 'no')
+
+
+class RingBufferTracer:
+    """Record traces, screenshots and console/network logs for a browser context.
+
+    Logs and page-load screenshots are kept in bounded in-memory ring buffers.
+    The Playwright trace is split into one chunk per page load and only the
+    last chunks are kept, so a long test never accumulates an unbounded trace.
+    Artifacts are copied to the output directory only when the test fails.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        enabled: bool = True,
+        depth: int = 200,
+        chunk_depth: int = 3,
+        screenshot_depth: int = 3,
+        sample_rate: float = 1.0,
+        snapshots: bool = True,
+    ):
+        """
+        Initialize the tracer
+
+        Args:
+            output_dir: Directory where artifacts of failed tests are written
+            enabled: Disable to make every call a no-op
+            depth: Maximum number of console/network entries kept in memory
+            chunk_depth: Maximum number of Playwright trace chunks (one per page load) kept
+            screenshot_depth: Maximum number of page-load screenshots kept in memory,
+                only taken for tests without a Playwright trace
+            sample_rate: Fraction of tests (0.0 - 1.0) that record a Playwright trace
+            snapshots: Include DOM snapshots in the Playwright trace
+        """
+        self.output_dir = Path(output_dir)
+        self.enabled = enabled
+        self.chunk_depth = max(chunk_depth, 1)
+        self.sample_rate = sample_rate
+        self.snapshots = snapshots
+        self.screenshot_depth = screenshot_depth
+        self.events: Deque[Tuple[float, str, str]] = deque(maxlen=depth)
+        self.screenshots: Deque[Tuple[float, bytes]] = deque(maxlen=screenshot_depth)
+        self.chunks: Deque[Path] = deque()
+        self.finish_seconds = 0.0
+        self.traced = False
+        self.finished = False
+        self._context: Optional[BrowserContext] = None
+        self._test_name = ''
+        self._chunk_dir: Optional[Path] = None
+        self._chunk_count = 0
+        self._chunk_lock: Optional[asyncio.Lock] = None
+        self._pending: Set['asyncio.Task[None]'] = set()
+
+    @classmethod
+    def from_env(cls) -> 'RingBufferTracer':
+        """Create a tracer configured from TRACE_* environment variables"""
+        return cls(
+            output_dir=os.getenv('TRACE_DIR', 'test-results/traces'),
+            enabled=_env_flag('TRACE_BUFFER', 'on'),
+            depth=int(os.getenv('TRACE_BUFFER_DEPTH', '200')),
+            chunk_depth=int(os.getenv('TRACE_CHUNK_DEPTH', '3')),
+            screenshot_depth=int(os.getenv('TRACE_SCREENSHOT_DEPTH', '3')),
+            sample_rate=float(os.getenv('TRACE_SAMPLE_RATE', '1.0')),
+            snapshots=_env_flag('TRACE_SNAPSHOTS', 'on'),
+        )
+
+    async def start(self, context: BrowserContext, test_name: str) -> None:
+        """
+        Start recording for a test
+
+        Args:
+            context: Browser context to record
+            test_name: Name used for the artifact directory if the test fails
+        """
+        if not self.enabled:
+            return
+
+        self.events.clear()
+        self.screenshots.clear()
+        self.chunks.clear()
+        self._context = context
+        self._test_name = test_name
+        self._chunk_count = 0
+        # Created here so the lock belongs to the running event loop
+        self._chunk_lock = asyncio.Lock()
+        self.finish_seconds = 0.0
+        self.finished = False
+        self.traced = random.random() < self.sample_rate
+
+        for page in context.pages:
+            self._attach(page)
+        context.on('page', self._attach)
+
+        if self.traced:
+            self._chunk_dir = Path(tempfile.mkdtemp(prefix='ring-trace-'))
+            await context.tracing.start(screenshots=True, snapshots=self.snapshots, sources=False)
+            await context.tracing.start_chunk()
+
+    async def finish(self, failed: bool) -> Optional[Path]:
+        """
+        Stop recording and write the buffers to disk if the test failed
+
+        Args:
+            failed: Whether the test failed
+
+        Returns:
+            Directory containing the artifacts, or None if nothing was written
+        """
+        if not self.enabled or self._context is None:
+            return None
+
+        started = time.perf_counter()
+        context = self._context
+        self.finished = True
+        context.remove_listener('page', self._attach)
+
+        # Let scheduled chunk rotations and screenshots complete first
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        self._context = None
+
+        if not failed:
+            if self.traced:
+                # Stopping without a path discards the current chunk
+                await context.tracing.stop_chunk()
+                await context.tracing.stop()
+                self._discard_chunks()
+            self.events.clear()
+            self.screenshots.clear()
+            self.finish_seconds = time.perf_counter() - started
+            return None
+
+        # Writing artifacts is a cost of the failure, not of the tracing mode
+        self.finish_seconds = time.perf_counter() - started
+        artifact_dir = self.output_dir / self._safe_name(self._test_name)
+        artifact_dir.mkdir(parents=True, exist_ok=True)
+
+        if self.traced:
+            await self._save_chunk(context)
+            await context.tracing.stop()
+            for idx, chunk in enumerate(self.chunks, 1):
+                shutil.move(str(chunk), str(artifact_dir / f'trace-{idx}.zip'))
+            self._discard_chunks()
+
+        with open(artifact_dir / 'events.log', 'w', encoding='utf-8') as log_file:
+            for timestamp, kind, message in self.events:
+                log_file.write(f'{timestamp:.3f} [{kind}] {message}\n')
+
+        for idx, (_, image) in enumerate(self.screenshots, 1):
+            (artifact_dir / f'screenshot-{idx}.png').write_bytes(image)
+
+        for idx, page in enumerate(context.pages, 1):
+            try:
+                await page.screenshot(path=str(artifact_dir / f'final-{idx}.png'))
+            except Exception:
+                pass  # Page may already be closed or crashed
+
+        self.events.clear()
+        self.screenshots.clear()
+        return artifact_dir
+
+    def _attach(self, page: Page) -> None:
+        """Register console, network and load listeners on a page"""
+        page.on('console', self._on_console)
+        page.on('pageerror', self._on_page_error)
+        page.on('request', self._on_request)
+        page.on('response', self._on_response)
+        page.on('requestfailed', self._on_request_failed)
+        if self.traced:
+            page.on('load', self._on_load_rotate)
+        elif self.screenshot_depth > 0:
+            # A recorded trace has its own screencast, so only untraced tests need these
+            page.on('load', self._on_load_screenshot)
+
+    def _record(self, kind: str, message: str) -> None:
+        """Append an entry to the event ring buffer"""
+        self.events.append((time.time(), kind, message))
+
+    def _on_console(self, message: ConsoleMessage) -> None:
+        self._record('console', f'{message.type}: {message.text}')
+
+    def _on_page_error(self, error: Any) -> None:
+        self._record('pageerror', str(error))
+
+    def _on_request(self, request: Request) -> None:
+        self._record('request', f'{request.method} {request.url}')
+
+    def _on_response(self, response: Response) -> None:
+        self._record('response', f'{response.status} {response.url}')
+
+    def _on_request_failed(self, request: Request) -> None:
+        self._record('requestfailed', f'{request.method} {request.url} {request.failure or ""}')
+
+    def _schedule(self, coroutine: Any) -> None:
+        """Run a coroutine in the background; finish() waits for it"""
+        task = asyncio.ensure_future(coroutine)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def _on_load_screenshot(self, page: Page) -> None:
+        self._schedule(self._capture_screenshot(page))
+
+    def _on_load_rotate(self, page: Page) -> None:
+        if not self.finished:
+            self._schedule(self._rotate_chunk())
+
+    async def _capture_screenshot(self, page: Page) -> None:
+        """Capture a screenshot into the screenshot ring buffer"""
+        try:
+            self.screenshots.append((time.time(), await page.screenshot()))
+        except Exception:
+            pass  # Page navigated away or closed before the capture finished
+
+    async def _rotate_chunk(self) -> None:
+        """Close the current trace chunk and start the next one"""
+        async with self._chunk_lock:
+            context = self._context
+            if context is None:
+                return
+            await self._save_chunk(context)
+            await context.tracing.start_chunk()
+
+    async def _save_chunk(self, context: BrowserContext) -> None:
+        """Export the current trace chunk and evict the oldest beyond chunk_depth"""
+        self._chunk_count += 1
+        chunk = self._chunk_dir / f'chunk-{self._chunk_count}.zip'
+        await context.tracing.stop_chunk(path=str(chunk))
+        self.chunks.append(chunk)
+        while len(self.chunks) > self.chunk_depth:
+            self.chunks.popleft().unlink()
+
+    def _discard_chunks(self) -> None:
+        """Remove the temporary chunk directory"""
+        if self._chunk_dir is not None:
+            shutil.rmtree(self._chunk_dir, ignore_errors=True)
+            self._chunk_dir = None
+        self.chunks.clear()
+
+    @staticmethod
+    def _safe_name(test_name: str) -> str:
+        """Turn a pytest node id into a file system friendly directory name"""
+        return re.sub(r'[^A-Za-z0-9_.-]+', '_', test_name).strip('_') or 'test'
+
+
+def load_duration_baseline(file_path: str) -> Dict[str, float]:
+    """
+    Read per-test durations recorded by a TRACE_BUFFER=off run
+
+    Args:
+        file_path: Path to the baseline JSON file
+
+    Returns:
+        Test node id to duration in seconds, empty if no baseline exists
+    """
+    if not os.path.exists(file_path):
+        return {}
+    with open(file_path, encoding='utf-8') as baseline_file:
+        return json.load(baseline_file)
+
+
+def save_duration_baseline(file_path: str, durations: Dict[str, float]) -> None:
+    """
+    Merge per-test durations into the baseline JSON file
+
+    Args:
+        file_path: Path to the baseline JSON file
+        durations: Test node id to duration in seconds
+    """
+    baseline = load_duration_baseline(file_path)
+    baseline.update(durations)
+    Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(file_path, 'w', encoding='utf-8') as baseline_file:
+        json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+        baseline_file.write('\n')
+
+
+def added_overhead(duration: float, finish_seconds: float, baseline: Optional[float]) -> Optional[float]:
+    """
+    Time tracing added to one test
+
+    Args:
+        duration: Setup and call duration with tracing on
+        finish_seconds: Time spent stopping the tracer during teardown
+        baseline: Setup and call duration of the same test with tracing off
+
+    Returns:
+        Added seconds, or None without a baseline
+    """
+    if baseline is None:
+        return None
+    return duration - baseline + finish_seconds
+
+
+def summarize_overhead(overheads: List[Optional[float]], baseline_path: str) -> List[str]:
+    """
+    Format per-test tracing overhead for the test report
+
+    Args:
+        overheads: Added seconds per traced test, None where the baseline has no entry
+        baseline_path: Baseline file, named in the report when entries are missing
+
+    Returns:
+        Report lines
+    """
+    measured = [overhead for overhead in overheads if overhead is not None]
+    lines = []
+    if measured:
+        mean_ms = sum(measured) / len(measured) * 1000
+        lines.append(
+            f'ring-buffer tracing overhead: {len(measured)} tests, mean {mean_ms:.1f} ms, '
+            f'max {max(measured) * 1000:.1f} ms per test'
+        )
+    missing = len(overheads) - len(measured)
+    if missing:
+        lines.append(
+            f'{missing} tests have no entry in {baseline_path}; '
+            'run them once with TRACE_BUFFER=off to record one'
+        )
+    return lines
@@ -0,0 +1,100 @@
+"""Shared pytest fixtures and hooks"""
+import os
+import pytest
+import pytest_asyncio
+from typing import Dict, List, Optional
+from playwright.async_api import async_playwright
+from dotenv import load_dotenv
+from src.utils.trace_buffer import (
+    RingBufferTracer,
+    added_overhead,
+    load_duration_baseline,
+    save_duration_baseline,
+    summarize_overhead,
+)
+
+load_dotenv()
+
+# Setup + call durations of a TRACE_BUFFER=off run, used to measure overhead
+TRACE_BASELINE = os.getenv('TRACE_BASELINE', 'test-results/trace-baseline.json')
+duration_baseline = load_duration_baseline(TRACE_BASELINE)
+
+# Per-test results collected during the session
+untraced_durations: Dict[str, float] = {}
+trace_overheads: List[Optional[float]] = []
+
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Expose the report of each phase on the test item (rep_setup, rep_call)"""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f'rep_{report.when}', report)
+
+
+def _test_failed(node) -> bool:
+    """Check whether setup or call failed; True if setup never reported"""
+    setup_report = getattr(node, 'rep_setup', None)
+    call_report = getattr(node, 'rep_call', None)
+    if setup_report is None:
+        return True
+    return setup_report.failed or (call_report is not None and call_report.failed)
+
+
+@pytest.fixture
+def ring_trace(request):
+    """Ring-buffer tracer; keeps artifacts only for failed tests"""
+    tracer = RingBufferTracer.from_env()
+    yield tracer
+
+    setup_report = getattr(request.node, 'rep_setup', None)
+    call_report = getattr(request.node, 'rep_call', None)
+    if setup_report is None or call_report is None or not call_report.passed:
+        return  # Only durations of passing tests are comparable between runs
+    duration = setup_report.duration + call_report.duration
+
+    if not tracer.enabled:
+        untraced_durations[request.node.nodeid] = duration
+        return
+
+    baseline = duration_baseline.get(request.node.nodeid)
+    overhead = added_overhead(duration, tracer.finish_seconds, baseline)
+    trace_overheads.append(overhead)
+    if overhead is not None:
+        request.node.user_properties.append(('trace_overhead_ms', round(overhead * 1000, 2)))
+
+
+@pytest_asyncio.fixture
+async def page(request, ring_trace):
+    """Browser page recorded by ring_trace; closes the browser after the test"""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        context = await browser.new_context(
+            base_url=os.getenv('BASE_URL', 'https://www.saucedemo.com')
+        )
+        try:
+            await ring_trace.start(context, request.node.nodeid)
+            yield await context.new_page()
+        finally:
+            await ring_trace.finish(_test_failed(request.node))
+            await browser.close()
+
+
+def pytest_sessionfinish(session):
+    """Store durations of a TRACE_BUFFER=off run as the overhead baseline"""
+    if untraced_durations:
+        save_duration_baseline(TRACE_BASELINE, untraced_durations)
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Add tracing overhead to the terminal report"""
+    if untraced_durations:
+        terminalreporter.write_sep('-', 'trace buffer')
+        terminalreporter.write_line(
+            f'ring-buffer tracing off: recorded {len(untraced_durations)} test durations '
+            f'to {TRACE_BASELINE}'
+        )
+    if trace_overheads:
+        terminalreporter.write_sep('-', 'trace buffer')
+        for line in summarize_overhead(trace_overheads, TRACE_BASELINE):
+            terminalreporter.write_line(line)
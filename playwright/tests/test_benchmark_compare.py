@@ -0,0 +1,91 @@
+import pytest
+from benchmarks import run
+from benchmarks.compare import compare_results, main, mann_whitney_p_value
+from benchmarks.results import SCHEMA_VERSION, build_results, load_results, save_results, summarize
+
+
+def make_results(samples_by_name):
+    """Build a results document from raw samples"""
+    return build_results(
+        {name: summarize(samples) for name, samples in samples_by_name.items()}, 'test'
+    )
+
+
+class TestBenchmarkCompare:
+    """Benchmark comparator tests - no browser required"""
+
+    def test_slower_samples_are_significant(self):
+        """Verify clearly slower samples give a small p-value"""
+        baseline = [1.00, 1.01, 0.99, 1.02, 1.00, 0.98]
+        current = [1.20, 1.21, 1.19, 1.22, 1.20, 1.18]
+        assert mann_whitney_p_value(baseline, current) < 0.01
+        assert mann_whitney_p_value(current, baseline) > 0.99
+
+    def test_identical_samples_are_not_significant(self):
+        """Verify identical samples never look like a regression"""
+        samples = [0.5, 0.5, 0.5, 0.5]
+        assert mann_whitney_p_value(samples, samples) == 1.0
+
+    def test_small_samples_use_exact_distribution(self):
+        """Verify complete separation of 5 vs 5 samples gives the exact p-value 1/252"""
+        baseline = [1.00, 1.01, 1.02, 1.03, 1.04]
+        current = [2.00, 2.01, 2.02, 2.03, 2.04]
+        assert mann_whitney_p_value(baseline, current) == pytest.approx(1 / 252)
+
+    def test_two_samples_marked_underpowered(self):
+        """Verify 2 vs 2 samples are never flagged and are marked underpowered"""
+        baseline = make_results({'excel.read[1000]': [1.00, 1.01]})
+        current = make_results({'excel.read[1000]': [2.00, 2.01]})
+
+        row = compare_results(baseline, current)[0]
+        assert row['underpowered']
+        assert not row['regression']
+
+    def test_regression_flagged(self):
+        """Verify a significant slowdown above the threshold is flagged"""
+        baseline = make_results({'excel.read[1000]': [1.00, 1.01, 0.99, 1.02, 1.00]})
+        current = make_results({'excel.read[1000]': [1.30, 1.31, 1.29, 1.32, 1.30]})
+
+        rows = compare_results(baseline, current)
+        assert rows[0]['regression']
+        assert rows[0]['change'] == pytest.approx(0.3, abs=0.01)
+
+    def test_small_slowdown_not_flagged(self):
+        """Verify a significant slowdown below the threshold is not flagged"""
+        baseline = make_results({'fixture.new_context': [1.00, 1.001, 0.999, 1.002, 1.000]})
+        current = make_results({'fixture.new_context': [1.02, 1.021, 1.019, 1.022, 1.020]})
+
+        assert not compare_results(baseline, current, threshold=0.05)[0]['regression']
+
+    def test_results_round_trip(self, tmp_path):
+        """Verify saved results load back with the schema version checked"""
+        results = make_results({'page.LoginPage.login': [0.1, 0.2]})
+        results_path = tmp_path / 'results.json'
+        save_results(results, str(results_path))
+
+        loaded = load_results(str(results_path))
+        assert loaded['schema_version'] == SCHEMA_VERSION
+        assert loaded['benchmarks']['page.LoginPage.login']['samples'] == [0.1, 0.2]
+
+        results['schema_version'] = SCHEMA_VERSION + 1
+        save_results(results, str(results_path))
+        with pytest.raises(ValueError):
+            load_results(str(results_path))
+
+    def test_environment_mismatch_warns_or_refuses(self, tmp_path, capsys):
+        """Verify differing environments warn, and --strict refuses to compare"""
+        baseline = make_results({'fixture.new_context': [1.0, 1.1, 1.2, 1.3, 1.4]})
+        current = make_results({'fixture.new_context': [1.0, 1.1, 1.2, 1.3, 1.4]})
+        current['environment']['machine'] = 'other'
+        baseline_path, current_path = str(tmp_path / 'baseline.json'), str(tmp_path / 'current.json')
+        save_results(baseline, baseline_path)
+        save_results(current, current_path)
+
+        assert main([baseline_path, current_path]) == 0
+        assert 'different environments' in capsys.readouterr().err
+        assert main([baseline_path, current_path, '--strict']) == 2
+
+    def test_run_rejects_too_few_repeats(self):
+        """Verify the runner refuses sample sizes the comparator cannot use"""
+        with pytest.raises(SystemExit):
+            run.main(['--suite', 'excel', '--repeats', '2'])
@@ -0,0 +1,40 @@
+import os
+import pytest
+from playwright.async_api import async_playwright
+from benchmarks import bench_excel, bench_pages
+
+
+async def chromium_available() -> bool:
+    """Check whether the Playwright Chromium build is installed"""
+    async with async_playwright() as p:
+        return os.path.exists(p.chromium.executable_path)
+
+
+class TestBenchmarkSuites:
+    """Smoke tests for the benchmark suites - small sizes, offline"""
+
+    def test_excel_suite(self):
+        """Verify the excel suite reports write and read throughput"""
+        results = bench_excel.run(repeats=2, row_counts=[10])
+
+        assert set(results) == {'excel.write[10]', 'excel.read[10]'}
+        for entry in results.values():
+            assert len(entry['samples']) == 2
+            assert entry['items'] == 10
+            assert entry['items_per_s'] > 0
+
+    @pytest.mark.asyncio
+    async def test_pages_suite(self):
+        """Verify the page-object suite runs against the static app"""
+        if not await chromium_available():
+            pytest.skip('Chromium is not installed, run "playwright install chromium"')
+
+        results = await bench_pages.run(repeats=2)
+
+        assert set(results) == {
+            'page.LoginPage.login',
+            'page.HomePage.get_product_details',
+            'page.CartPage.remove_from_cart_by_name',
+        }
+        for entry in results.values():
+            assert len(entry['samples']) == 2
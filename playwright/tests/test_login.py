@@ -1,7 +1,7 @@
 import pytest
 import os
 from pathlib import Path
-from playwright.async_api import async_playwright, Page
+from playwright.async_api import Page
 from src.pages.login_page import LoginPage
 from src.pages.home_page import HomePage
 from src.utils.excel_utility import ExcelUtility
@@ -24,15 +24,11 @@ class TestLogin:
     """Login feature tests - Data driven from Excel"""
 
     @pytest.fixture(autouse=True)
-    async def setup(self):
+    async def setup(self, page):
         """Setup before each test"""
-        async with async_playwright() as p:
-            self.browser = await p.chromium.launch()
-            self.page = await self.browser.new_page()
-            self.login_page = LoginPage(self.page)
-            await self.login_page.navigate_to()
-            yield
-            await self.browser.close()
+        self.page = page
+        self.login_page = LoginPage(self.page)
+        await self.login_page.navigate_to()
 
     @pytest.mark.asyncio
     async def test_login_page_visible(self):
@@ -1,6 +1,6 @@
 import pytest
 import os
-from playwright.async_api import async_playwright, Page
+from playwright.async_api import Page
 from src.pages.login_page import LoginPage
 from src.pages.home_page import HomePage
 from dotenv import load_dotenv
@@ -12,23 +12,17 @@ class TestSocialMedia:
     """Social media links verification tests"""
 
     @pytest.fixture(autouse=True)
-    async def setup(self):
+    async def setup(self, page):
         """Setup before each test - login first"""
-        async with async_playwright() as p:
-            self.browser = await p.chromium.launch()
-            self.page = await self.browser.new_page()
-            self.login_page = LoginPage(self.page)
-            self.home_page = HomePage(self.page)
-
-            # Login
-            valid_username = os.getenv('VALID_USERNAME', 'standard_user')
-            valid_password = os.getenv('VALID_PASSWORD', 'secret_sauce')
-            await self.login_page.navigate_to()
-            await self.login_page.login_with_valid_credentials(valid_username, valid_password)
-
-            yield
-
-            await self.browser.close()
+        self.page = page
+        self.login_page = LoginPage(self.page)
+        self.home_page = HomePage(self.page)
+
+        # Login
+        valid_username = os.getenv('VALID_USERNAME', 'standard_user')
+        valid_password = os.getenv('VALID_PASSWORD', 'secret_sauce')
+        await self.login_page.navigate_to()
+        await self.login_page.login_with_valid_credentials(valid_username, valid_password)
 
     @pytest.mark.asyncio
     async def test_linkedin_link_visible(self):
@@ -0,0 +1,197 @@
+import pytest
+from src.utils.trace_buffer import (
+    RingBufferTracer,
+    added_overhead,
+    load_duration_baseline,
+    save_duration_baseline,
+    summarize_overhead,
+)
+
+
+class FakeTracing:
+    """Records tracing calls and writes a placeholder file for exported chunks"""
+
+    def __init__(self):
+        self.calls = []
+        self.chunk = 0
+
+    async def start(self, **options):
+        self.calls.append(('start', options))
+
+    async def start_chunk(self):
+        self.chunk += 1
+        self.calls.append(('start_chunk', None))
+
+    async def stop_chunk(self, path=None):
+        self.calls.append(('stop_chunk', path))
+        if path:
+            with open(path, 'w') as trace_file:
+                trace_file.write(f'chunk {self.chunk}')
+
+    async def stop(self, path=None):
+        self.calls.append(('stop', path))
+
+
+class FakePage:
+    """Page stand-in that exposes registered listeners"""
+
+    def __init__(self):
+        self.listeners = {}
+
+    def on(self, event, handler):
+        self.listeners[event] = handler
+
+    async def screenshot(self, path=None):
+        if path:
+            with open(path, 'wb') as image_file:
+                image_file.write(b'final')
+        return b'png'
+
+
+class FakeContext:
+    """Browser context stand-in with one page"""
+
+    def __init__(self):
+        self.pages = [FakePage()]
+        self.tracing = FakeTracing()
+
+    def on(self, event, handler):
+        pass
+
+    def remove_listener(self, event, handler):
+        pass
+
+
+class TestTraceBuffer:
+    """Ring-buffer tracer tests - no browser required"""
+
+    def test_events_are_bounded_by_depth(self, tmp_path):
+        """Verify only the most recent events are kept"""
+        tracer = RingBufferTracer(str(tmp_path), depth=3)
+        for idx in range(10):
+            tracer._record('console', f'message {idx}')
+
+        assert [message for _, _, message in tracer.events] == [
+            'message 7', 'message 8', 'message 9'
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_test_writes_artifacts(self, tmp_path):
+        """Verify a failed traced test saves the trace, events and final screenshot"""
+        context = FakeContext()
+        tracer = RingBufferTracer(str(tmp_path / 'out'), sample_rate=1.0)
+        await tracer.start(context, 'tests/test_login.py::TestLogin::test_login_success')
+        tracer._record('console', 'error: boom')
+
+        artifact_dir = await tracer.finish(failed=True)
+
+        assert [name for name, _ in context.tracing.calls] == ['start', 'start_chunk', 'stop_chunk', 'stop']
+        assert (artifact_dir / 'trace-1.zip').read_text() == 'chunk 1'
+        assert 'error: boom' in (artifact_dir / 'events.log').read_text()
+        assert (artifact_dir / 'final-1.png').exists()
+
+    @pytest.mark.asyncio
+    async def test_trace_keeps_last_chunks(self, tmp_path):
+        """Verify only the newest chunk_depth trace chunks are kept"""
+        context = FakeContext()
+        tracer = RingBufferTracer(str(tmp_path / 'out'), sample_rate=1.0, chunk_depth=2)
+        await tracer.start(context, 'test_chunks')
+        page = context.pages[0]
+        for _ in range(4):
+            page.listeners['load'](page)
+
+        artifact_dir = await tracer.finish(failed=True)
+
+        assert sorted(path.name for path in artifact_dir.glob('trace-*.zip')) == ['trace-1.zip', 'trace-2.zip']
+        assert (artifact_dir / 'trace-1.zip').read_text() == 'chunk 4'
+        assert (artifact_dir / 'trace-2.zip').read_text() == 'chunk 5'
+
+    @pytest.mark.asyncio
+    async def test_failed_untraced_test_writes_load_screenshots(self, tmp_path):
+        """Verify page-load screenshots are saved for tests without a trace"""
+        context = FakeContext()
+        tracer = RingBufferTracer(str(tmp_path), sample_rate=0.0, screenshot_depth=2)
+        await tracer.start(context, 'test_untraced')
+        page = context.pages[0]
+        for _ in range(3):
+            page.listeners['load'](page)
+
+        artifact_dir = await tracer.finish(failed=True)
+
+        assert sorted(path.name for path in artifact_dir.glob('screenshot-*.png')) == [
+            'screenshot-1.png', 'screenshot-2.png'
+        ]
+        assert not list(artifact_dir.glob('trace-*.zip'))
+
+    @pytest.mark.asyncio
+    async def test_passed_test_discards_trace(self, tmp_path):
+        """Verify a passing test discards the trace and writes nothing"""
+        context = FakeContext()
+        tracer = RingBufferTracer(str(tmp_path / 'out'), sample_rate=1.0)
+        await tracer.start(context, 'test_passed')
+        chunk_dir = tracer._chunk_dir
+        page = context.pages[0]
+        page.listeners['load'](page)
+        tracer._record('request', 'GET /')
+
+        assert await tracer.finish(failed=False) is None
+        assert context.tracing.calls[-2:] == [('stop_chunk', None), ('stop', None)]
+        assert not tracer.events
+        assert not chunk_dir.exists()
+        assert not (tmp_path / 'out').exists()
+
+    @pytest.mark.asyncio
+    async def test_zero_sample_rate_never_traces(self, tmp_path):
+        """Verify sample_rate=0 never starts a Playwright trace"""
+        context = FakeContext()
+        tracer = RingBufferTracer(str(tmp_path), sample_rate=0.0)
+        for _ in range(5):
+            await tracer.start(context, 'test_sampled')
+            await tracer.finish(failed=True)
+
+        assert context.tracing.calls == []
+        assert 'load' in context.pages[0].listeners
+
+    @pytest.mark.asyncio
+    async def test_traced_test_skips_load_screenshots(self, tmp_path):
+        """Verify traced tests rotate trace chunks instead of taking extra screenshots"""
+        context = FakeContext()
+        tracer = RingBufferTracer(str(tmp_path), sample_rate=1.0)
+        await tracer.start(context, 'test_traced')
+
+        assert context.pages[0].listeners['load'] == tracer._on_load_rotate
+        await tracer.finish(failed=False)
+
+    @pytest.mark.asyncio
+    async def test_disabled_tracer_is_noop(self, tmp_path):
+        """Verify a disabled tracer never touches the context or the disk"""
+        tracer = RingBufferTracer(str(tmp_path), enabled=False)
+        await tracer.start(None, 'tests/test_login.py::TestLogin::test_login_success')
+
+        assert await tracer.finish(failed=True) is None
+        assert not any(tmp_path.iterdir())
+
+    def test_safe_name_from_node_id(self):
+        """Verify node ids become valid directory names"""
+        name = RingBufferTracer._safe_name('tests/test_login.py::TestLogin::test_login_success')
+        assert name == 'tests_test_login.py_TestLogin_test_login_success'
+
+    def test_added_overhead(self):
+        """Verify overhead compares against the untraced duration plus teardown cost"""
+        assert added_overhead(1.25, 0.05, 1.0) == pytest.approx(0.3)
+        assert added_overhead(1.25, 0.05, None) is None
+
+    def test_duration_baseline_round_trip(self, tmp_path):
+        """Verify baseline durations merge into the stored file"""
+        baseline_path = str(tmp_path / 'baseline.json')
+        assert load_duration_baseline(baseline_path) == {}
+
+        save_duration_baseline(baseline_path, {'test_a': 1.0})
+        save_duration_baseline(baseline_path, {'test_b': 2.0})
+        assert load_duration_baseline(baseline_path) == {'test_a': 1.0, 'test_b': 2.0}
+
+    def test_summarize_overhead(self):
+        """Verify the summary reports measured overhead and missing baselines"""
+        lines = summarize_overhead([0.001, 0.003, None], 'baseline.json')
+        assert lines[0] == 'ring-buffer tracing overhead: 2 tests, mean 2.0 ms, max 3.0 ms per test'
+        assert lines[1].startswith('1 tests have no entry in baseline.json')